@@ -1,11 +1,76 @@
+import itertools
 import numpy as np
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 from .survey import BaseSurvey
-from .utils import mkvc, validate_ndarray_with_shape, validate_float, validate_type
+from .utils import (
+    mkvc,
+    validate_ndarray_with_shape,
+    validate_float,
+    validate_integer,
+    validate_type,
+)
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 __all__ = ["Data", "SyntheticData"]
 
+# Number of data above which the uncertainties are computed with numba
+_NUMBA_MIN_SIZE = 1_000_000
+
+# Size of the chunks processed by each thread when numba is not used
+_THREAD_CHUNK_SIZE = 1 << 20
+
+if numba is not None:
+    from numba import njit, prange
+
+    @njit(parallel=True, nogil=True, cache=True)
+    def _standard_deviation_kernel(dobs, relative_error, noise_floor, out):
+        """Compute the uncertainties of the data in a single pass."""
+        for i in prange(dobs.shape[0]):
+            out[i] = np.hypot(relative_error[i] * abs(dobs[i]), noise_floor[i])
+
+    @njit(parallel=True, nogil=True, cache=True)
+    def _standard_deviation_kernel_scalar(dobs, relative_error, noise_floor, out):
+        """Compute the uncertainties for a scalar relative error and noise floor."""
+        for i in prange(dobs.shape[0]):
+            out[i] = np.hypot(relative_error * abs(dobs[i]), noise_floor)
+
+
+def _standard_deviation_numpy(dobs, relative_error, noise_floor, out, n_threads=1):
+    """Compute the uncertainties of the data with NumPy ufuncs.
+
+    The ufuncs release the GIL while they run, so if *n_threads* is larger
+    than 1, large arrays are split in chunks that are processed concurrently
+    by a pool of *n_threads* threads. Otherwise the data are processed in the
+    calling thread.
+    """
+
+    def compute(index):
+        np.absolute(dobs[index], out=out[index])
+        np.multiply(out[index], chunk(relative_error, index), out=out[index])
+        if noise_floor is not None:
+            np.hypot(out[index], chunk(noise_floor, index), out=out[index])
+
+    def chunk(value, index):
+        return value if isinstance(value, float) else value[index]
+
+    n_data = len(out)
+    if n_data <= _THREAD_CHUNK_SIZE or n_threads == 1:
+        compute(slice(None))
+        return
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        chunks = (
+            slice(start, start + _THREAD_CHUNK_SIZE)
+            for start in range(0, n_data, _THREAD_CHUNK_SIZE)
+        )
+        # consume the results to propagate any exception
+        list(executor.map(compute, chunks))
+
 
 class Data:
     r"""Class for defining data in SimPEG.
@@ -33,6 +98,10 @@ class Data:
         deviations of the Gaussian noise. This is essentially the same as *noise_floor*.
         If set however, this will override *relative_error* and *noise_floor*. If none
         are given, this defaults to 0.0
+    dtype : {numpy.float64, numpy.float32}, optional
+        Floating point precision of the observed data and uncertainties. Complex
+        data are stored with the matching complex precision. Using
+        ``numpy.float32`` halves the memory used by these arrays.
 
     Notes
     -----
@@ -58,14 +127,21 @@ class Data:
         relative_error=None,
         noise_floor=None,
         standard_deviation=None,
-        **kwargs
+        dtype=np.float64,
+        **kwargs,
     ):
         super().__init__(**kwargs)
         self.survey = survey
+        self._standard_deviation_cache = None
+
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise TypeError(f"dtype must be float32 or float64, got {dtype}")
+        self._dtype = dtype
 
         # Observed data
         if dobs is None:
-            dobs = np.full(survey.nD, np.nan)  # initialize data as nans
+            dobs = np.full(survey.nD, np.nan, dtype=dtype)  # initialize as nans
         self.dobs = dobs
 
         self.relative_error = relative_error
@@ -88,6 +164,31 @@ class Data:
         ):
             self.standard_deviation = 0.0
 
+    @classmethod
+    def _unchecked(cls, survey, dobs, relative_error=None, noise_floor=None):
+        """Create a data object without validating its inputs.
+
+        This is meant for internal code that already builds *dobs* as a
+        float or complex array of shape (survey.nD, ); none of the inputs are
+        checked. If neither *relative_error* nor *noise_floor* is given, the
+        uncertainties default to zero as in :py:class:`Data`.
+
+        Returns
+        -------
+        simpeg.data.Data
+        """
+        data = cls.__new__(cls)
+        data._survey = survey
+        data._dobs = dobs
+        data._nD = len(dobs)
+        data._dtype = np.finfo(dobs.dtype).dtype
+        if relative_error is None and noise_floor is None:
+            relative_error = noise_floor = 0.0
+        data._relative_error = relative_error
+        data._noise_floor = noise_floor
+        data._standard_deviation_cache = None
+        return data
+
     #######################
     # Properties
     #######################
@@ -106,6 +207,16 @@ class Data:
     def survey(self, value):
         self._survey = validate_type("survey", value, BaseSurvey, cast=False)
 
+    @property
+    def dtype(self):
+        """Floating point precision of the observed data and uncertainties.
+
+        Returns
+        -------
+        numpy.dtype
+        """
+        return self._dtype
+
     @property
     def dobs(self):
         """Vector of the observed data.
@@ -123,14 +234,34 @@ class Data:
         >>> for src in survey.source_list:
         ...     for rx in src.receiver_list:
         ...         data[src, rx] = datum
+
+        When the data of all source-receiver pairs are already concatenated
+        in the survey order, :py:meth:`bulk_set` replaces this loop with a
+        single copy.
         """
         return self._dobs
 
     @dobs.setter
     def dobs(self, value):
-        self._dobs = validate_ndarray_with_shape(
-            "dobs", value, shape=(self.survey.nD,), dtype=(float, complex)
-        )
+        # re-assigning the current array only needs to refresh the uncertainties
+        if value is not getattr(self, "_dobs", None):
+            # bind contiguous arrays of the right type and shape without a copy
+            if not (
+                isinstance(value, np.ndarray)
+                and value.dtype == self._dtype
+                and value.shape == (self.survey.nD,)
+                and value.flags.c_contiguous
+            ):
+                value = validate_ndarray_with_shape(
+                    "dobs",
+                    value,
+                    shape=(self.survey.nD,),
+                    dtype=(self._dtype, np.result_type(self._dtype, np.complex64)),
+                )
+                value = np.ascontiguousarray(value)
+            self._dobs = value
+            self._nD = len(value)
+        self._standard_deviation_cache = None
 
     @property
     def relative_error(self):
@@ -158,6 +289,12 @@ class Data:
         -------
         None or float or numpy.ndarray
         """
+        # scalars are only expanded to a full array when requested; the array
+        # then replaces the scalar so that it can be modified in place
+        if isinstance(self._relative_error, float):
+            self._relative_error = np.full(
+                self._nD, self._relative_error, dtype=self._dtype
+            )
         return self._relative_error
 
     @relative_error.setter
@@ -165,15 +302,17 @@ class Data:
         if value is not None:
             try:
                 value = validate_float("relative_error", value)
-                value = np.full(self.survey.nD, value)
             except TypeError:
-                pass
-            value = validate_ndarray_with_shape(
-                "relative_error", value, shape=(self.survey.nD,)
-            )
+                value = validate_ndarray_with_shape(
+                    "relative_error", value, shape=(self._nD,), dtype=self._dtype
+                )
             if np.any(value < 0.0):
                 raise ValueError("relative_error must be positive.")
+            if not isinstance(value, float):
+                # copy to a contiguous array owned by the data
+                value = np.array(value, dtype=self._dtype, order="C")
         self._relative_error = value
+        self._standard_deviation_cache = None
 
     @property
     def noise_floor(self):
@@ -201,6 +340,10 @@ class Data:
         -------
         None or float or numpy.ndarray
         """
+        # scalars are only expanded to a full array when requested; the array
+        # then replaces the scalar so that it can be modified in place
+        if isinstance(self._noise_floor, float):
+            self._noise_floor = np.full(self._nD, self._noise_floor, dtype=self._dtype)
         return self._noise_floor
 
     @noise_floor.setter
@@ -208,15 +351,17 @@ class Data:
         if value is not None:
             try:
                 value = validate_float("noise_floor", value)
-                value = np.full(self.survey.nD, value)
             except TypeError:
-                pass
-            value = validate_ndarray_with_shape(
-                "noise_floor", value, shape=(self.survey.nD,)
-            )
+                value = validate_ndarray_with_shape(
+                    "noise_floor", value, shape=(self._nD,), dtype=self._dtype
+                )
             if np.any(value < 0.0):
                 raise ValueError("noise_floor must be positive.")
+            if not isinstance(value, float):
+                # copy to a contiguous array owned by the data
+                value = np.array(value, dtype=self._dtype, order="C")
         self._noise_floor = value
+        self._standard_deviation_cache = None
 
     @property
     def standard_deviation(self):
@@ -234,6 +379,19 @@ class Data:
         .. math::
             \varepsilon = \sqrt{\varepsilon_{floor}^2 + \big ( C_{err} |d| \big )^2}
 
+        The computed uncertainties are cached until *dobs*, *relative_error*
+        or *noise_floor* are set again. If any of these arrays are modified in
+        place, call :py:meth:`invalidate_standard_deviation` so that the
+        uncertainties are recomputed on the next access.
+
+        The cached uncertainties are returned as a read-only array, so in-place
+        operators such as ``data.standard_deviation *= 2`` raise an error. Set
+        the uncertainties instead, e.g.
+        ``data.standard_deviation = 2 * data.standard_deviation``.
+
+        Use :py:meth:`compute_standard_deviation` to recompute the uncertainties
+        into an existing array instead.
+
         Returns
         -------
         numpy.ndarray
@@ -241,24 +399,18 @@ class Data:
             are independent Gaussian with zero mean, the uncertainties represent
             estimates of the standard deviations of the noise on the data.
         """
-        if self.relative_error is None and self.noise_floor is None:
-            raise TypeError(
-                "The relative_error and / or noise_floor must be set "
-                "before asking for uncertainties. Alternatively, the "
-                "standard_deviation can be set directly"
+        uncert = getattr(self, "_standard_deviation_cache", None)
+        if uncert is None:
+            uncert = self._compute_standard_deviation_into(
+                np.empty(self._nD, dtype=self._dtype)
             )
-
-        uncert = np.zeros(self.nD)
-        if self.relative_error is not None:
-            uncert += (self.relative_error * np.absolute(self.dobs)) ** 2
-        if self.noise_floor is not None:
-            uncert += self.noise_floor**2
-
-        return np.sqrt(uncert)
+            uncert.setflags(write=False)
+            self._standard_deviation_cache = uncert
+        return uncert
 
     @standard_deviation.setter
     def standard_deviation(self, value):
-        self.relative_error = np.zeros(self.nD)
+        self.relative_error = 0.0
         self.noise_floor = value
 
     @property
@@ -270,7 +422,7 @@ class Data:
         int
             The number of observed data
         """
-        return len(self.dobs)
+        return self._nD
 
     @property
     def shape(self):
@@ -287,7 +439,11 @@ class Data:
     def index_dictionary(self):
         """Dictionary for indexing data by sources and receiver.
 
-        FULL DESCRIPTION REQUIRED
+        The data associated with each source-receiver pair are stored
+        contiguously, so ``index_dictionary[src][rx]`` is a ``slice`` and
+        indexing any data array with it returns a view. Use
+        :py:meth:`get_index` with ``as_array=True`` if the integer indices are
+        needed instead.
 
         Returns
         -------
@@ -296,44 +452,305 @@ class Data:
 
         Examples
         --------
-        NEED EXAMPLE (1D TEM WOULD BE GOOD)
+        >>> index = data.index_dictionary[src][rx]
+        >>> data.dobs[index] = datum
 
         """
         if getattr(self, "_index_dictionary", None) is None:
+            receiver_index, starts, stops = self._build_receiver_index()
+            starts, stops = starts.tolist(), stops.tolist()
+            self._index_dictionary = {
+                src: {
+                    rx: slice(starts[ii], stops[ii])
+                    for rx, ii in receiver_index[src].items()
+                }
+                for src in self.survey.source_list
+            }
+
+        return self._index_dictionary
+
+    ##########################
+    # Methods
+    ##########################
+
+    def _build_receiver_index(self):
+        """Build the data index ranges of the source-receiver pairs.
+
+        The data of the *i*-th source-receiver pair are stored in
+        ``dobs[starts[i]:stops[i]]``. The ranges are only built once.
+
+        Returns
+        -------
+        receiver_index : dict
+            Nested dictionary mapping sources and receivers to an integer.
+        starts, stops : numpy.ndarray of int
+            Start and stop of the data index range of each source-receiver pair.
+        """
+        if getattr(self, "_receiver_index", None) is None:
             if self.survey is None:
                 raise Exception(
                     "To set or get values by source-receiver pairs, a survey must "
                     "first be set. `data.survey = survey`"
                 )
 
-            # create an empty dict
-            self._index_dictionary = {}
+            source_list = self.survey.source_list
+            sizes = np.fromiter(
+                (nD for src in source_list for nD in src.vnD), dtype=np.int64
+            )
+            self._index_stops = np.cumsum(sizes)
+            self._index_starts = self._index_stops - sizes
 
-            # create an empty dict associated with each source
-            for src in self.survey.source_list:
-                self._index_dictionary[src] = {}
+            counter = itertools.count()
+            self._receiver_index = {
+                src: {rx: next(counter) for rx in src.receiver_list}
+                for src in source_list
+            }
 
-            # loop over sources and find the associated data indices
-            indBot, indTop = 0, 0
-            for src in self.survey.source_list:
-                for rx in src.receiver_list:
-                    indTop += rx.nD
-                    self._index_dictionary[src][rx] = np.arange(indBot, indTop)
-                    indBot += rx.nD
+        return self._receiver_index, self._index_starts, self._index_stops
 
-        return self._index_dictionary
+    def compute_standard_deviation(self, out=None, n_threads=1):
+        """Compute the uncertainties of the data.
 
-    ##########################
-    # Methods
-    ##########################
+        Unlike :py:attr:`standard_deviation`, the uncertainties are always
+        recomputed and written to an array owned by the caller.
+
+        Parameters
+        ----------
+        out : (nD) numpy.ndarray, optional
+            Writeable, contiguous array with the precision of the data in which
+            the uncertainties are stored. It must not overlap *dobs*,
+            *relative_error* or *noise_floor*. A new array is allocated if
+            ``None``.
+        n_threads : int, default: 1
+            Number of threads used to compute the uncertainties. By default the
+            uncertainties are computed in the calling thread, so inversion
+            drivers can fill the arrays of several data objects from their own
+            pool of threads without oversubscribing the processors.
+
+        Returns
+        -------
+        numpy.ndarray
+            The uncertainties of the data, stored in *out* if given.
+        """
+        if out is None:
+            out = np.empty(self._nD, dtype=self._dtype)
+        return self._compute_standard_deviation_into(out, n_threads=n_threads)
+
+    def _compute_standard_deviation_into(self, out, n_threads=1):
+        """Compute the uncertainties of the data into an existing array.
+
+        The computation does not use the cache of :py:attr:`standard_deviation`.
+        The numba kernels run without holding the GIL, while the NumPy
+        computation only releases it inside each ufunc.
+
+        Parameters
+        ----------
+        out : (nD) numpy.ndarray
+            Writeable, contiguous array with the precision of the data.
+        n_threads : int, default: 1
+            Number of threads used to compute the uncertainties.
+
+        Returns
+        -------
+        numpy.ndarray
+            The *out* array filled with the uncertainties.
+        """
+        n_threads = validate_integer("n_threads", n_threads, min_val=1)
+        if not (
+            isinstance(out, np.ndarray)
+            and out.shape == (self._nD,)
+            and out.dtype == self._dtype
+            and out.flags.c_contiguous
+            and out.flags.writeable
+        ):
+            raise ValueError(
+                f"out must be a writeable contiguous {self._dtype} array of shape "
+                f"({self._nD},)"
+            )
+        if any(
+            isinstance(value, np.ndarray) and np.may_share_memory(out, value)
+            for value in (
+                self._dobs,
+                self._relative_error,
+                self._noise_floor,
+            )
+        ):
+            raise ValueError("out must not overlap the data or its uncertainties")
+
+        # use the stored values so that scalars broadcast without expansion
+        relative_error = self._relative_error
+        noise_floor = self._noise_floor
+        if relative_error is None and noise_floor is None:
+            raise TypeError(
+                "The relative_error and / or noise_floor must be set "
+                "before asking for uncertainties. Alternatively, the "
+                "standard_deviation can be set directly"
+            )
+
+        # a zero scalar relative error, e.g. after setting the
+        # standard_deviation directly, does not need a pass over the data
+        if (
+            noise_floor is not None
+            and isinstance(relative_error, float)
+            and relative_error == 0.0
+        ):
+            relative_error = None
+
+        if relative_error is None:
+            out[...] = noise_floor
+        elif (
+            numba is not None
+            and noise_floor is not None
+            and self._nD >= _NUMBA_MIN_SIZE
+            and all(
+                isinstance(value, float)
+                or (value.dtype == self._dtype and value.flags.c_contiguous)
+                for value in (self._dobs, relative_error, noise_floor)
+            )
+        ):
+            # the number of numba threads is set for the calling thread only
+            n_numba_threads = numba.get_num_threads()
+            numba.set_num_threads(min(n_threads, numba.config.NUMBA_NUM_THREADS))
+            try:
+                self._run_standard_deviation_kernel(relative_error, noise_floor, out)
+            finally:
+                numba.set_num_threads(n_numba_threads)
+        else:
+            _standard_deviation_numpy(
+                self._dobs, relative_error, noise_floor, out, n_threads=n_threads
+            )
+
+        return out
+
+    def _run_standard_deviation_kernel(self, relative_error, noise_floor, out):
+        """Compute the uncertainties of the data with the numba kernels."""
+        if isinstance(relative_error, float) and isinstance(noise_floor, float):
+            # scalars are passed by value and stay out of the data stream
+            _standard_deviation_kernel_scalar(
+                self._dobs,
+                self._dtype.type(relative_error),
+                self._dtype.type(noise_floor),
+                out,
+            )
+        else:
+            # a single scalar is expanded as a zero-stride view
+            relative_error, noise_floor = (
+                (
+                    np.broadcast_to(self._dtype.type(value), self._nD)
+                    if isinstance(value, float)
+                    else value
+                )
+                for value in (relative_error, noise_floor)
+            )
+            _standard_deviation_kernel(self._dobs, relative_error, noise_floor, out)
+
+    def invalidate_standard_deviation(self):
+        """Discard the cached uncertainties.
+
+        The uncertainties returned by :py:attr:`standard_deviation` are cached
+        and only recomputed when *dobs*, *relative_error* or *noise_floor* are
+        set. Call this method after modifying any of these arrays in place,
+        e.g. ``data.relative_error[index] = value``.
+        """
+        self._standard_deviation_cache = None
+
+    def get_index(self, source, receiver, as_array=False):
+        """Get the data indices of a source-receiver pair.
+
+        Parameters
+        ----------
+        source : simpeg.survey.BaseSrc
+            A source of the survey.
+        receiver : simpeg.survey.BaseRx
+            A receiver of *source*.
+        as_array : bool, optional
+            Return the indices as an integer array instead of a slice, e.g.
+            for scattering with ``np.add.at``.
+
+        Returns
+        -------
+        slice or numpy.ndarray of int
+            The range of the data associated with the source-receiver pair.
+
+        Examples
+        --------
+        >>> index = data.get_index(src, rx)
+        >>> data.dobs[index] = datum
+        """
+        receiver_index, starts, stops = self._build_receiver_index()
+        ii = receiver_index[source][receiver]
+        if as_array:
+            return np.arange(starts[ii], stops[ii])
+        return slice(int(starts[ii]), int(stops[ii]))
+
+    def bulk_set(self, values):
+        """Copy the data of all source-receiver pairs into the observed data.
+
+        Parameters
+        ----------
+        values : (nD) numpy.ndarray
+            Data of every source-receiver pair, concatenated in the order of
+            the survey's sources and receivers.
+
+        Examples
+        --------
+        Instead of looping over the sources and receivers
+
+        >>> for src in survey.source_list:
+        ...     for rx in src.receiver_list:
+        ...         data[src, rx] = datum
+
+        the concatenated data can be set at once
+
+        >>> data.bulk_set(np.concatenate(datums))
+        """
+        values = validate_ndarray_with_shape(
+            "values",
+            values,
+            shape=(self.nD,),
+            dtype=(self._dtype, np.result_type(self._dtype, np.complex64)),
+        )
+        np.copyto(self.dobs, values)
+        self.invalidate_standard_deviation()
+
+    def bulk_set_by_receivers(self, receiver_indices, values):
+        """Set the observed data of a subset of the source-receiver pairs.
+
+        Parameters
+        ----------
+        receiver_indices : (n_receivers) array_like of int
+            Positions of the source-receiver pairs, counted over the receivers
+            of each source in the order of the survey's sources.
+        values : numpy.ndarray
+            Data of the selected source-receiver pairs, concatenated in the
+            order of *receiver_indices*.
+        """
+        _, starts, stops = self._build_receiver_index()
+        receiver_indices = validate_ndarray_with_shape(
+            "receiver_indices", receiver_indices, shape=("*",), dtype=int
+        )
+        starts = starts[receiver_indices]
+        sizes = stops[receiver_indices] - starts
+        n_data = sizes.sum()
+
+        values = mkvc(np.asarray(values))
+        if values.size != n_data:
+            raise ValueError(
+                f"values must have {n_data} elements for the selected receivers, "
+                f"got {values.size}"
+            )
+
+        # offset of each datum from its position within the concatenated values
+        offsets = np.repeat(starts - (np.cumsum(sizes) - sizes), sizes)
+        np.put(self.dobs, offsets + np.arange(n_data), values)
+        self.invalidate_standard_deviation()
 
     def __setitem__(self, key, value):
-        index = self.index_dictionary[key[0]][key[1]]
-        self.dobs[index] = mkvc(value)
+        self.dobs[self.get_index(key[0], key[1])] = mkvc(value)
+        self.invalidate_standard_deviation()
 
     def __getitem__(self, key):
-        index = self.index_dictionary[key[0]][key[1]]
-        return self.dobs[index]
+        return self.dobs[self.get_index(key[0], key[1])].copy()
 
     def tovec(self):
         """Convert observed data to a vector
@@ -361,6 +778,39 @@ class Data:
         v = mkvc(v)
         self.dobs = v
 
+    def astype(self, dtype):
+        """Copy the data with a different floating point precision.
+
+        Parameters
+        ----------
+        dtype : {numpy.float64, numpy.float32}
+            Floating point precision of the new data object.
+
+        Returns
+        -------
+        simpeg.data.Data
+            A new data object of the same class with the observed data and
+            uncertainties cast to *dtype*.
+        """
+        # the uncertainties are copied by their setters, but casting dobs does
+        # not copy it when the dtype is unchanged
+        relative_error = self._relative_error
+        noise_floor = self._noise_floor
+        if relative_error is None and noise_floor is None:
+            relative_error = 0.0
+        # subclasses may define constructors without a dtype argument, so the
+        # copy is initialized as a base data object
+        data = type(self).__new__(type(self))
+        Data.__init__(
+            data,
+            self.survey,
+            dobs=self.dobs.copy(),
+            relative_error=relative_error,
+            noise_floor=noise_floor,
+            dtype=dtype,
+        )
+        return data
+
 
 class SyntheticData(Data):
     r"""Synthetic data class.
@@ -385,20 +835,29 @@ class SyntheticData(Data):
     noise_floor : float or np.ndarray
         Assign floor/absolute uncertainties to the data. For each datum, we assume
         standard deviation of Gaussian noise is equal to *noise_floor*.
+    dtype : {numpy.float64, numpy.float32}, optional
+        Floating point precision of the observed data and uncertainties.
     """
 
     def __init__(
-        self, survey, dobs=None, dclean=None, relative_error=None, noise_floor=None
+        self,
+        survey,
+        dobs=None,
+        dclean=None,
+        relative_error=None,
+        noise_floor=None,
+        dtype=np.float64,
     ):
         super(SyntheticData, self).__init__(
             survey=survey,
             dobs=dobs,
             relative_error=relative_error,
             noise_floor=noise_floor,
+            dtype=dtype,
         )
 
         if dclean is None:
-            dclean = np.full(self.survey.nD, np.nan)
+            dclean = np.full(self.nD, np.nan, dtype=self.dtype)
         self.dclean = dclean
 
     @property
@@ -427,5 +886,26 @@ class SyntheticData(Data):
     @dclean.setter
     def dclean(self, value):
         self._dclean = validate_ndarray_with_shape(
-            "dclean", value, shape=(self.survey.nD,), dtype=(float, complex)
+            "dclean",
+            value,
+            shape=(self.survey.nD,),
+            dtype=(self._dtype, np.result_type(self._dtype, np.complex64)),
         )
+
+    def astype(self, dtype):
+        """Copy the synthetic data with a different floating point precision.
+
+        Parameters
+        ----------
+        dtype : {numpy.float64, numpy.float32}
+            Floating point precision of the new data object.
+
+        Returns
+        -------
+        simpeg.data.SyntheticData
+            A new synthetic data object with the observed data, clean data and
+            uncertainties cast to *dtype*.
+        """
+        data = super().astype(dtype)
+        data.dclean = self.dclean.copy()
+        return data
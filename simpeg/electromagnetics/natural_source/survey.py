@@ -28,10 +28,19 @@ class Data(BaseData, DataNSEMPlotMethods):
         Relative error
     noise_floor : numpy.ndarray, optional
         Noise floor
+    dtype : {numpy.float64, numpy.float32}, optional
+        Floating point precision of the observed data and uncertainties.
     """
 
-    def __init__(self, survey, dobs=None, relative_error=None, noise_floor=None):
-        BaseData.__init__(self, survey, dobs, relative_error, noise_floor)
+    def __init__(
+        self,
+        survey,
+        dobs=None,
+        relative_error=None,
+        noise_floor=None,
+        dtype=np.float64,
+    ):
+        BaseData.__init__(self, survey, dobs, relative_error, noise_floor, dtype=dtype)
 
     def toRecArray(self, returnType="RealImag"):
         """
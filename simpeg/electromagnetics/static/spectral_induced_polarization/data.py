@@ -58,6 +58,7 @@ class Data(BaseData):
     def __setitem__(self, key, value):
         index = self.index_dictionary[key[0]][key[1]][key[2]]
         self.dobs[index] = mkvc(value)
+        self.invalidate_standard_deviation()
 
     def __getitem__(self, key):
         index = self.index_dictionary[key[0]][key[1]][key[2]]
@@ -285,7 +285,7 @@ class BaseSimulation(props.HasModel):
 
             f = self.fields(m)
 
-        data = Data(self.survey)
+        data = Data._unchecked(self.survey, np.full(self.survey.nD, np.nan))
         for src in self.survey.source_list:
             for rx in src.receiver_list:
                 data[src, rx] = rx.eval(src, self.mesh, f)
@@ -695,7 +695,7 @@ class BaseTimeSimulation(BaseSimulation):
         if f is None:
             f = self.fields(m)
 
-        data = Data(self.survey)
+        data = Data._unchecked(self.survey, np.full(self.survey.nD, np.nan))
         for src in self.survey.source_list:
             for rx in src.receiver_list:
                 data[src, rx] = rx.eval(src, self.mesh, self.time_mesh, f)
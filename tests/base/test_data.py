@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 import numpy as np
 import discretize
@@ -6,6 +7,8 @@ import discretize
 from simpeg import maps
 from simpeg import simulation, survey
 from simpeg import Data
+from simpeg.data import SyntheticData
+from simpeg import data as data_module
 
 
 class DataTest(unittest.TestCase):
@@ -66,3 +69,260 @@ class DataTest(unittest.TestCase):
 
         np.testing.assert_equal(data.noise_floor, standard_deviation)
         np.testing.assert_equal(data.standard_deviation, standard_deviation)
+
+    def test_standard_deviation_cache(self):
+        data = Data(self.sim.survey, dobs=self.dobs, relative_error=0.5)
+        standard_deviation = data.standard_deviation
+        self.assertIs(data.standard_deviation, standard_deviation)
+
+        self.assertFalse(standard_deviation.flags.writeable)
+
+        # the cached uncertainties cannot be modified in place
+        with self.assertRaises(ValueError):
+            data.standard_deviation *= 2
+        data.standard_deviation = 2 * data.standard_deviation
+        np.testing.assert_allclose(data.standard_deviation, np.abs(self.dobs))
+        np.testing.assert_equal(data.relative_error, np.zeros(len(self.dobs)))
+        data.relative_error = 0.5
+
+        # setting an input recomputes the uncertainties
+        data.noise_floor = 1.0
+        np.testing.assert_allclose(
+            data.standard_deviation, np.sqrt((0.5 * np.abs(self.dobs)) ** 2 + 1.0)
+        )
+
+        # in place modifications require an explicit invalidation
+        data.relative_error[:] = 0.0
+        data.invalidate_standard_deviation()
+        np.testing.assert_equal(data.standard_deviation, np.ones(len(self.dobs)))
+
+    def test_scalar_uncertainties(self):
+        data = Data(
+            self.sim.survey, dobs=self.dobs, relative_error=0.5, noise_floor=1.0
+        )
+        # scalars broadcast in the uncertainties without being expanded
+        np.testing.assert_allclose(
+            data.standard_deviation, np.sqrt((0.5 * np.abs(self.dobs)) ** 2 + 1.0)
+        )
+        self.assertIsInstance(data._relative_error, float)
+        self.assertIsInstance(data._noise_floor, float)
+
+        # reading an uncertainty expands it to an array that can be modified
+        np.testing.assert_equal(data.relative_error, np.full(len(self.dobs), 0.5))
+        self.assertIsInstance(data._noise_floor, float)
+        data.relative_error[0] = 0.0
+        data.invalidate_standard_deviation()
+        self.assertEqual(data.standard_deviation[0], 1.0)
+        np.testing.assert_equal(data.noise_floor, np.ones(len(self.dobs)))
+
+        with self.assertRaises(ValueError):
+            data.noise_floor = -1.0
+
+    def test_unchecked(self):
+        data = Data._unchecked(self.sim.survey, self.dobs)
+        self.assertIs(data.dobs, self.dobs)
+        np.testing.assert_equal(data.standard_deviation, np.zeros(len(self.dobs)))
+        np.testing.assert_equal(data.relative_error, np.zeros(len(self.dobs)))
+
+    def test_set_standard_deviation(self):
+        data = Data(self.sim.survey, dobs=self.dobs, relative_error=0.5)
+        standard_deviation = np.abs(self.dobs) + 1.0
+        data.standard_deviation = standard_deviation
+        np.testing.assert_equal(data.standard_deviation, standard_deviation)
+        np.testing.assert_equal(data.relative_error, np.zeros(len(self.dobs)))
+
+        data.standard_deviation = 0.1
+        np.testing.assert_equal(data.standard_deviation, np.full(len(self.dobs), 0.1))
+
+    def test_dtype(self):
+        data = Data(
+            self.sim.survey, dobs=self.dobs, relative_error=0.5, noise_floor=1.0
+        )
+        self.assertEqual(data.dtype, np.float64)
+
+        data32 = data.astype(np.float32)
+        self.assertEqual(data32.dtype, np.float32)
+        for array in [
+            data32.dobs,
+            data32.relative_error,
+            data32.noise_floor,
+            data32.standard_deviation,
+        ]:
+            self.assertEqual(array.dtype, np.float32)
+        np.testing.assert_allclose(
+            data32.standard_deviation, data.standard_deviation, rtol=1e-6
+        )
+
+        # the copy does not share memory with the original data
+        self.assertFalse(np.shares_memory(data.astype(np.float64).dobs, data.dobs))
+
+        with self.assertRaises(TypeError):
+            Data(self.sim.survey, dobs=self.dobs, dtype=int)
+
+    def test_astype_subclass_init(self):
+        class CustomData(Data):
+            def __init__(self, survey, dobs=None, relative_error=None):
+                super().__init__(survey, dobs=dobs, relative_error=relative_error)
+
+        data = CustomData(self.sim.survey, dobs=self.dobs, relative_error=0.5)
+        data32 = data.astype(np.float32)
+        self.assertIsInstance(data32, CustomData)
+        self.assertEqual(data32.dtype, np.float32)
+        np.testing.assert_allclose(
+            data32.standard_deviation, data.standard_deviation, rtol=1e-6
+        )
+
+    def test_astype_subclass(self):
+        dclean = self.dobs + 1.0
+        data = SyntheticData(
+            self.sim.survey, dobs=self.dobs, dclean=dclean, relative_error=0.5
+        )
+        data32 = data.astype(np.float32)
+        self.assertIsInstance(data32, SyntheticData)
+        self.assertEqual(data32.dclean.dtype, np.float32)
+        self.assertFalse(np.shares_memory(data32.dclean, data.dclean))
+        np.testing.assert_allclose(data32.dclean, dclean, rtol=1e-6)
+        np.testing.assert_allclose(
+            data32.standard_deviation, data.standard_deviation, rtol=1e-6
+        )
+
+    @unittest.skipIf(data_module.numba is None, "numba is not installed")
+    def test_standard_deviation_numba(self):
+        n_data = len(self.dobs)
+        for relative, floor in [
+            (np.linspace(0.1, 0.5, n_data), np.linspace(1.0, 2.0, n_data)),
+            (0.5, np.linspace(1.0, 2.0, n_data)),
+            (np.linspace(0.1, 0.5, n_data), 1.0),
+            (0.5, 1.0),
+        ]:
+            expected = np.sqrt((relative * np.abs(self.dobs)) ** 2 + floor**2)
+            for dtype in [np.float64, np.float32]:
+                data = Data(
+                    self.sim.survey,
+                    dobs=self.dobs,
+                    relative_error=relative,
+                    noise_floor=floor,
+                    dtype=dtype,
+                )
+                with mock.patch.object(data_module, "_NUMBA_MIN_SIZE", 0):
+                    standard_deviation = data.standard_deviation
+                    computed = data.compute_standard_deviation(n_threads=1)
+                self.assertEqual(standard_deviation.dtype, dtype)
+                np.testing.assert_allclose(standard_deviation, expected, rtol=1e-6)
+                np.testing.assert_allclose(computed, expected, rtol=1e-6)
+
+        # unset data propagate as NaN
+        data = Data(self.sim.survey, relative_error=0.5, noise_floor=1.0)
+        with mock.patch.object(data_module, "_NUMBA_MIN_SIZE", 0):
+            self.assertTrue(np.all(np.isnan(data.standard_deviation)))
+
+    def test_compute_standard_deviation_into(self):
+        relative = np.linspace(0.1, 0.5, len(self.dobs))
+        data = Data(self.sim.survey, dobs=self.dobs, relative_error=relative)
+        data.noise_floor = 1.0
+        expected = np.sqrt((relative * np.abs(self.dobs)) ** 2 + 1.0)
+
+        out = np.empty(len(self.dobs))
+        with mock.patch.object(data_module, "_THREAD_CHUNK_SIZE", 3):
+            with mock.patch.object(data_module, "_NUMBA_MIN_SIZE", np.inf):
+                # by default the uncertainties are computed in the calling thread
+                with mock.patch.object(
+                    data_module, "ThreadPoolExecutor", side_effect=AssertionError
+                ):
+                    self.assertIs(data.compute_standard_deviation(out=out), out)
+                    np.testing.assert_allclose(out, expected)
+                    np.testing.assert_allclose(data.standard_deviation, expected)
+
+                # split the NumPy computation over several threads
+                out[:] = 0.0
+                data._compute_standard_deviation_into(out, n_threads=2)
+                np.testing.assert_allclose(out, expected)
+
+        with self.assertRaises(ValueError):
+            data._compute_standard_deviation_into(out, n_threads=0)
+
+        with self.assertRaises(ValueError):
+            data._compute_standard_deviation_into(np.empty(len(self.dobs) - 1))
+        with self.assertRaises(ValueError):
+            data._compute_standard_deviation_into(np.empty(len(self.dobs), np.float32))
+
+    def test_uncertainty_copies(self):
+        relative = np.linspace(0.1, 0.5, len(self.dobs))
+        floor = np.linspace(1.0, 2.0, len(self.dobs))
+        data = Data(
+            self.sim.survey, dobs=self.dobs, relative_error=relative, noise_floor=floor
+        )
+        # the uncertainties are copied
+        self.assertFalse(np.shares_memory(data.relative_error, relative))
+        np.testing.assert_equal(data.relative_error, relative)
+        np.testing.assert_equal(data.noise_floor, floor)
+
+        # setting one uncertainty leaves the array of the other one in place
+        noise_floor = data.noise_floor
+        data.relative_error = 2 * relative
+        noise_floor[:] = 10.0
+        data.invalidate_standard_deviation()
+        np.testing.assert_allclose(
+            data.standard_deviation, np.hypot(2 * relative * np.abs(self.dobs), 10.0)
+        )
+
+        # and does not overwrite arrays returned earlier
+        relative_error = data.relative_error
+        data.relative_error = relative
+        np.testing.assert_equal(relative_error, 2 * relative)
+
+    def test_uncertainty_survey_change(self):
+        data = Data(self.sim.survey, dobs=self.dobs, relative_error=np.ones(20))
+
+        receivers = survey.BaseRx(30 * [[0.0]])
+        data.survey = survey.BaseSurvey([survey.BaseSrc([receivers])])
+        data.dobs = np.ones(30)
+        data.relative_error = 0.5 * np.ones(30)
+        data.noise_floor = np.ones(30)
+        np.testing.assert_allclose(data.standard_deviation, np.hypot(0.5, 1.0))
+
+    def test_standard_deviation_survey_change(self):
+        data = Data(self.sim.survey, dobs=self.dobs, noise_floor=1.0)
+        self.assertEqual(data.standard_deviation.shape, (20,))
+
+        receivers = survey.BaseRx(30 * [[0.0]])
+        data.survey = survey.BaseSurvey([survey.BaseSrc([receivers])])
+        data.dobs = np.ones(30)
+        np.testing.assert_equal(data.standard_deviation, np.ones(30))
+
+    def test_dobs_binding(self):
+        data = Data(self.sim.survey, dobs=self.dobs)
+        self.assertIs(data.dobs, self.dobs)
+
+        # strided and single precision inputs are copied to contiguous arrays
+        dobs = np.repeat(self.dobs, 2)[::2]
+        data.dobs = dobs
+        self.assertTrue(data.dobs.flags.c_contiguous)
+        np.testing.assert_equal(data.dobs, self.dobs)
+
+        data.dobs = self.dobs.astype(np.float32)
+        self.assertEqual(data.dobs.dtype, np.float64)
+
+        with self.assertRaises(ValueError):
+            data.dobs = self.dobs[:-1]
+
+    def test_compute_standard_deviation(self):
+        data = Data(self.sim.survey, dobs=self.dobs, relative_error=0.5)
+        standard_deviation = data.standard_deviation
+
+        # recomputing does not overwrite the uncertainties returned earlier
+        data.noise_floor = 1.0
+        expected = np.sqrt((0.5 * np.abs(self.dobs)) ** 2 + 1.0)
+        np.testing.assert_allclose(data.standard_deviation, expected)
+        np.testing.assert_allclose(standard_deviation, 0.5 * np.abs(self.dobs))
+
+        computed = data.compute_standard_deviation()
+        self.assertFalse(np.shares_memory(computed, standard_deviation))
+        np.testing.assert_allclose(computed, expected)
+
+        out = np.empty(len(self.dobs))
+        self.assertIs(data.compute_standard_deviation(out=out), out)
+        np.testing.assert_allclose(out, expected)
+
+        with self.assertRaises(ValueError):
+            data.compute_standard_deviation(out=data.noise_floor)
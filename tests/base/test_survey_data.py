@@ -40,6 +40,43 @@ class TestData(unittest.TestCase):
         D2 = data.Data(self.D.survey, V)
         self.assertTrue(np.all(D2.dobs == self.D.dobs))
 
+    def test_get_index(self):
+        for src in self.D.survey.source_list:
+            for rx in src.receiver_list:
+                index = self.D.get_index(src, rx)
+                self.assertIsInstance(index, slice)
+                self.assertEqual(index, self.D.index_dictionary[src][rx])
+                np.testing.assert_equal(
+                    np.arange(self.D.nD)[index],
+                    self.D.get_index(src, rx, as_array=True),
+                )
+                v = np.random.rand(rx.nD)
+                self.D[src, rx] = v
+                np.testing.assert_equal(self.D[src, rx], v)
+
+    def test_bulk_set(self):
+        V = np.random.rand(self.D.nD)
+        self.D.bulk_set(V)
+        np.testing.assert_equal(self.D.dobs, V)
+        self.assertRaises(ValueError, self.D.bulk_set, V[:-1])
+
+        # update the second and last source-receiver pairs
+        rx_list = [
+            (src, rx) for src in self.D.survey.source_list for rx in src.receiver_list
+        ]
+        values = [np.random.rand(rx_list[ii][1].nD) for ii in [-1, 1]]
+        self.D.bulk_set_by_receivers([len(rx_list) - 1, 1], np.concatenate(values))
+        np.testing.assert_equal(self.D[rx_list[-1]], values[0])
+        np.testing.assert_equal(self.D[rx_list[1]], values[1])
+        np.testing.assert_equal(self.D[rx_list[0]], V[: rx_list[0][1].nD])
+
+        # single precision data are set with the precision of the data
+        D32 = data.Data(self.D.survey, relative_error=1.0, dtype=np.float32)
+        np.testing.assert_equal(D32.standard_deviation, np.nan)
+        D32.bulk_set(V.astype(np.float32))
+        self.assertEqual(D32.dobs.dtype, np.float32)
+        np.testing.assert_allclose(D32.standard_deviation, V, rtol=1e-6)
+
     def test_standard_dev(self):
         V = []
         for src in self.D.survey.source_list: